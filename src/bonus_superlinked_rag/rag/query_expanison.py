@@ -1,3 +1,5 @@
+import re
+
 from langchain_openai import ChatOpenAI
 
 from llm.chain import GeneralChain
@@ -6,6 +8,10 @@ from config import settings
 
 
 class QueryExpansion:
+    separator_pattern = re.compile(
+        rf"\s*{re.escape(QueryExpansionTemplate().separator)}\s*"
+    )
+
     @staticmethod
     def generate_response(query: str, to_expand_to_n: int) -> list[str]:
         query_expansion_template = QueryExpansionTemplate()
@@ -19,9 +25,6 @@ class QueryExpansion:
         response = chain.invoke({"question": query})
         result = response["expanded_queries"]
 
-        queries = result.strip().split(query_expansion_template.separator)
-        stripped_queries = [
-            stripped_item for item in queries if (stripped_item := item.strip())
-        ]
+        queries = QueryExpansion.separator_pattern.split(result.strip())
 
-        return stripped_queries
+        return [query for query in queries if query]
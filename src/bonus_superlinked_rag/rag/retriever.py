@@ -92,7 +92,9 @@ class VectorRetriever:
         return documents
 
     def rerank(self, documents: list[Document], keep_top_k: int) -> list[str]:
-        content_list = [document.content for document in documents]
+        # The expanded queries often retrieve the same documents. Send each passage
+        # only once in the single batched rerank prompt.
+        content_list = list(dict.fromkeys(document.content for document in documents))
         rerank_documents = self._reranker.generate_response(
             query=self.query, passages=content_list, keep_top_k=keep_top_k
         )
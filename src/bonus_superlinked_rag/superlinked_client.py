@@ -4,6 +4,7 @@ import httpx
 
 from config import settings
 from models.documents import ArticleDocument, PostDocument, RepositoryDocument
+from singleton import SingletonMeta
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -12,11 +13,14 @@ logger = get_logger(__name__)
 T = TypeVar("T", ArticleDocument, PostDocument, RepositoryDocument)
 
 
-class SuperlinkedClient:
+class SuperlinkedClient(metaclass=SingletonMeta):
     def __init__(self, base_url=settings.SUPERLINKED_SERVER_URL) -> None:
         self.base_url = base_url
         self.timeout = 600
         self.headers = {"Accept": "*/*", "Content-Type": "application/json"}
+        # One pooled client per process (SuperlinkedClient is a singleton), so
+        # keep-alive connections are reused across searches and across queries.
+        self._http = httpx.Client(headers=self.headers, timeout=self.timeout)
 
         self._content_weight = 0.9
         self._platform_weight = 0.1
@@ -33,9 +37,7 @@ class SuperlinkedClient:
     def __ingest(self, url: str, data: T) -> None:
         logger.info(f"Sending {type(data)} {data.id} to Superlinked at {url}")
 
-        response = httpx.post(
-            url, headers=self.headers, json=data.model_dump(), timeout=self.timeout
-        )
+        response = self._http.post(url, json=data.model_dump())
 
         if response.status_code != 202:
             raise httpx.HTTPStatusError(
@@ -99,9 +101,7 @@ class SuperlinkedClient:
             "platform_weight": self._platform_weight,
         }
         logger.info(f"Searching Superlinked for {document_class.__name__} at: {url}")
-        response = httpx.post(
-            url, headers=self.headers, json=data, timeout=self.timeout
-        )
+        response = self._http.post(url, json=data)
 
         if response.status_code != 200:
             raise httpx.HTTPStatusError(
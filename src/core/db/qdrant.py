@@ -37,6 +37,19 @@ class QdrantDatabaseConnector:
             vectors_config=VectorParams(
                 size=settings.EMBEDDING_SIZE, distance=Distance.COSINE
             ),
+            # HNSW graph parameters: M edges per node and the candidate list size
+            # used while building the graph.
+            hnsw_config=models.HnswConfigDiff(m=16, ef_construct=200),
+            # Keep an INT8 copy of the vectors in RAM for the similarity scan
+            # (4x less memory traffic than FP32). The original FP32 vectors are
+            # used only to rescore the top candidates at search time.
+            quantization_config=models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
+            ),
         )
 
     def write_data(self, collection_name: str, points: Batch):
@@ -53,12 +66,52 @@ class QdrantDatabaseConnector:
         query_vector: list,
         query_filter: models.Filter | None = None,
         limit: int = 3,
+        rescore_oversampling: float = 2.0,
+        hnsw_ef: int | None = None,
     ) -> list:
         return self._instance.search(
             collection_name=collection_name,
             query_vector=query_vector,
             query_filter=query_filter,
             limit=limit,
+            search_params=models.SearchParams(
+                hnsw_ef=hnsw_ef,
+                quantization=models.QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=rescore_oversampling,
+                )
+            ),
+        )
+
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: list[list],
+        query_filter: models.Filter | None = None,
+        limit: int = 3,
+        rescore_oversampling: float = 2.0,
+        hnsw_ef: int | None = None,
+    ) -> list[list]:
+        search_params = models.SearchParams(
+            hnsw_ef=hnsw_ef,
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=rescore_oversampling,
+            ),
+        )
+        requests = [
+            models.SearchRequest(
+                vector=query_vector,
+                filter=query_filter,
+                limit=limit,
+                params=search_params,
+                with_payload=True,
+            )
+            for query_vector in query_vectors
+        ]
+
+        return self._instance.search_batch(
+            collection_name=collection_name, requests=requests
         )
 
     def scroll(self, collection_name: str, limit: int):
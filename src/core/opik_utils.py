@@ -84,7 +84,10 @@ def create_dataset_from_artifacts(
 
                 continue
 
-            testing_artifact_file = list(artifact_dir.glob("*_testing.json"))
+            # Newer artifacts are published as JSON Lines, older ones as a JSON array.
+            testing_artifact_file = list(artifact_dir.glob("*_testing.jsonl")) or list(
+                artifact_dir.glob("*_testing.json")
+            )
             assert (
                 len(testing_artifact_file) == 1
             ), "Expected exactly one testing artifact file."
@@ -92,7 +95,10 @@ def create_dataset_from_artifacts(
 
             logger.info(f"Loading testing data from: {testing_artifact_file}")
             with open(testing_artifact_file, "r") as file:
-                items = json.load(file)
+                if testing_artifact_file.suffix == ".jsonl":
+                    items = [json.loads(line) for line in file if line.strip()]
+                else:
+                    items = json.load(file)
 
             enhanced_items = [
                 {**item, "artifact_name": artifact_name} for item in items
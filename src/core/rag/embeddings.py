@@ -0,0 +1,59 @@
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+
+import numpy as np
+from sentence_transformers.SentenceTransformer import SentenceTransformer
+
+
+class CachedEmbedder:
+    """
+    Embeds query strings through an LRU cache keyed by the SHA-256 of the text,
+    so repeated queries skip the embedding model entirely.
+    """
+
+    def __init__(self, model_id: str, maxsize: int = 10_000) -> None:
+        self._model = SentenceTransformer(model_id)
+        self._maxsize = maxsize
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = Lock()
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        keys = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+
+        with self._lock:
+            vectors = [self._get(key) for key in keys]
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            embeddings = self._model.encode(
+                [texts[i] for i in missing], batch_size=len(missing)
+            )
+            with self._lock:
+                for i, embedding in zip(missing, embeddings, strict=True):
+                    embedding.setflags(write=False)
+                    vectors[i] = embedding
+                    self._put(keys[i], embedding)
+
+        return np.stack(vectors)
+
+    def _get(self, key: str) -> np.ndarray | None:
+        vector = self._cache.get(key)
+        if vector is not None:
+            self._cache.move_to_end(key)
+
+        return vector
+
+    def _put(self, key: str, vector: np.ndarray) -> None:
+        self._cache[key] = vector
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def get_embedder(model_id: str) -> CachedEmbedder:
+    """Return the process-wide embedder for `model_id`, shared by all retrievers."""
+
+    return CachedEmbedder(model_id)
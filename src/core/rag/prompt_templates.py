@@ -1,10 +1,63 @@
+import functools
 from abc import ABC, abstractmethod
+from string import Formatter
+from typing import Any, Callable
 
 from langchain.prompts import PromptTemplate
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+
+
+def compile_template(template: str, **partial_variables: Any) -> Callable[..., str]:
+    """
+    Parse an f-string style template once into a closure that formats it.
+
+    The partial variables are substituted at compile time; the remaining
+    placeholders are filled by keyword arguments when calling the closure.
+    """
+
+    literals = [""]
+    fields = []
+    for literal, field_name, _, _ in Formatter().parse(template):
+        literals[-1] += literal
+        if field_name is None:
+            continue
+
+        if field_name in partial_variables:
+            literals[-1] += str(partial_variables[field_name])
+        else:
+            fields.append(field_name)
+            literals.append("")
+
+    head, tail = literals[0], list(zip(fields, literals[1:], strict=True))
+
+    def format_template(**kwargs: Any) -> str:
+        parts = [head]
+        for field_name, literal in tail:
+            parts.append(str(kwargs[field_name]))
+            parts.append(literal)
+
+        return "".join(parts)
+
+    return format_template
+
+
+def cache_template(create_template: Callable) -> Callable:
+    """Memoize `create_template` per template instance and call arguments."""
+
+    @functools.wraps(create_template)
+    def wrapper(self: "BasePromptTemplate", *args: Any, **kwargs: Any) -> Any:
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in self._templates:
+            self._templates[key] = create_template(self, *args, **kwargs)
+
+        return self._templates[key]
+
+    return wrapper
 
 
 class BasePromptTemplate(ABC, BaseModel):
+    _templates: dict = PrivateAttr(default_factory=dict)
+
     @abstractmethod
     def create_template(self, *args) -> PromptTemplate:
         pass
@@ -18,10 +71,19 @@ class QueryExpansionTemplate(BasePromptTemplate):
     Provide these alternative questions seperated by '{separator}'.
     Original question: {question}"""
 
+    _format_prompt: Callable[..., str]
+
+    def model_post_init(self, __context: Any) -> None:
+        self._format_prompt = compile_template(self.prompt, separator=self.separator)
+
     @property
     def separator(self) -> str:
         return "#next-question#"
 
+    def format(self, question: str, to_expand_to_n: int) -> str:
+        return self._format_prompt(question=question, to_expand_to_n=to_expand_to_n)
+
+    @cache_template
     def create_template(self, to_expand_to_n: int) -> PromptTemplate:
         return PromptTemplate(
             template=self.prompt,
@@ -57,6 +119,7 @@ class SelfQueryTemplate(BasePromptTemplate):
     
     User question: {question}"""
 
+    @cache_template
     def create_template(self) -> PromptTemplate:
         return PromptTemplate(template=self.prompt, input_variables=["question"])
 
@@ -74,6 +137,19 @@ class RerankingTemplate(BasePromptTemplate):
     {passages}
     """
 
+    _format_prompt: Callable[..., str]
+
+    def model_post_init(self, __context: Any) -> None:
+        self._format_prompt = compile_template(self.prompt, separator=self.separator)
+
+    def format(self, question: str, passages: list[str], keep_top_k: int) -> str:
+        return self._format_prompt(
+            question=question,
+            passages=self.separator.join(passages),
+            keep_top_k=keep_top_k,
+        )
+
+    @cache_template
     def create_template(self, keep_top_k: int) -> PromptTemplate:
         return PromptTemplate(
             template=self.prompt,
@@ -1,3 +1,5 @@
+import re
+
 import opik
 from config import settings
 from langchain_openai import ChatOpenAI
@@ -8,26 +10,33 @@ from core.rag.prompt_templates import QueryExpansionTemplate
 
 class QueryExpansion:
     opik_tracer = OpikTracer(tags=["QueryExpansion"])
+    query_expansion_template = QueryExpansionTemplate()
+    # Splits on the separator and swallows the surrounding whitespace (including
+    # literal "\n" sequences the LLM sometimes emits) in a single pass.
+    separator_pattern = re.compile(
+        rf"(?:\s|\\n)*{re.escape(query_expansion_template.separator)}(?:\s|\\n)*"
+    )
+    # Same whitespace/literal "\n" cleanup for the start and end of the response.
+    edge_pattern = re.compile(r"^(?:\s|\\n)+|(?:\s|\\n)+$")
 
     @staticmethod
     @opik.track(name="QueryExpansion.generate_response")
     def generate_response(query: str, to_expand_to_n: int) -> list[str]:
-        query_expansion_template = QueryExpansionTemplate()
-        prompt = query_expansion_template.create_template(to_expand_to_n)
+        query_expansion_template = QueryExpansion.query_expansion_template
+        prompt = query_expansion_template.format(
+            question=query, to_expand_to_n=to_expand_to_n
+        )
         model = ChatOpenAI(
             model=settings.OPENAI_MODEL_ID,
             api_key=settings.OPENAI_API_KEY,
             temperature=0,
         )
-        chain = prompt | model
-        chain = chain.with_config({"callbacks": [QueryExpansion.opik_tracer]})
+        chain = model.with_config({"callbacks": [QueryExpansion.opik_tracer]})
 
-        response = chain.invoke({"question": query})
+        response = chain.invoke(prompt)
         response = response.content
 
-        queries = response.strip().split(query_expansion_template.separator)
-        stripped_queries = [
-            stripped_item for item in queries if (stripped_item := item.strip(" \\n"))
-        ]
+        response = QueryExpansion.edge_pattern.sub("", response)
+        queries = QueryExpansion.separator_pattern.split(response)
 
-        return stripped_queries
+        return [query for query in queries if query]
@@ -5,22 +5,24 @@ from core.rag.prompt_templates import RerankingTemplate
 
 
 class Reranker:
+    reranking_template = RerankingTemplate()
+
     @staticmethod
     def generate_response(
         query: str, passages: list[str], keep_top_k: int
     ) -> list[str]:
-        reranking_template = RerankingTemplate()
-        prompt = reranking_template.create_template(keep_top_k=keep_top_k)
+        reranking_template = Reranker.reranking_template
         model = ChatOpenAI(
             model=settings.OPENAI_MODEL_ID, api_key=settings.OPENAI_API_KEY
         )
-        chain = prompt | model
 
         stripped_passages = [
             stripped_item for item in passages if (stripped_item := item.strip())
         ]
-        passages = reranking_template.separator.join(stripped_passages)
-        response = chain.invoke({"question": query, "passages": passages})
+        prompt = reranking_template.format(
+            question=query, passages=stripped_passages, keep_top_k=keep_top_k
+        )
+        response = model.invoke(prompt)
         response = response.content
 
         reranked_passages = response.strip().split(reranking_template.separator)
@@ -3,11 +3,11 @@ import concurrent.futures
 import opik
 from config import settings
 from qdrant_client import models
-from sentence_transformers.SentenceTransformer import SentenceTransformer
 
 import core.logger_utils as logger_utils
 from core import lib
 from core.db.qdrant import QdrantDatabaseConnector
+from core.rag.embeddings import get_embedder
 from core.rag.query_expanison import QueryExpansion
 from core.rag.reranking import Reranker
 from core.rag.self_query import SelfQuery
@@ -23,74 +23,87 @@ class VectorRetriever:
     def __init__(self, query: str) -> None:
         self._client = QdrantDatabaseConnector()
         self.query = query
-        self._embedder = SentenceTransformer(settings.EMBEDDING_MODEL_ID)
+        self._embedder = get_embedder(settings.EMBEDDING_MODEL_ID)
         self._query_expander = QueryExpansion()
         self._metadata_extractor = SelfQuery()
         self._reranker = Reranker()
 
-    def _search_single_query(self, generated_query: str, author_id: str, k: int):
+    def _search_collection(
+        self,
+        collection_name: str,
+        author_key: str,
+        query_vectors: list[list[float]],
+        author_id: str,
+        k: int,
+        hnsw_ef: int | None,
+    ) -> list[list]:
+        return self._client.search_batch(
+            collection_name=collection_name,
+            query_vectors=query_vectors,
+            query_filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key=author_key,
+                        match=models.MatchValue(
+                            value=author_id,
+                        ),
+                    )
+                ]
+                if author_id
+                else None
+            ),
+            limit=k // 3,
+            hnsw_ef=hnsw_ef,
+        )
+
+    def _search_queries(
+        self,
+        generated_queries: list[str],
+        author_id: str,
+        k: int,
+        hnsw_ef: int | None,
+    ) -> list:
         assert k > 3, "k should be greater than 3"
 
-        query_vector = self._embedder.encode(generated_query).tolist()
-
-        vectors = [
-            self._client.search(
-                collection_name="vector_posts",
-                query_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="author_id",
-                            match=models.MatchValue(
-                                value=author_id,
-                            ),
-                        )
-                    ]
-                    if author_id
-                    else None
-                ),
-                query_vector=query_vector,
-                limit=k // 3,
-            ),
-            self._client.search(
-                collection_name="vector_articles",
-                query_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="author_id",
-                            match=models.MatchValue(
-                                value=author_id,
-                            ),
-                        )
-                    ]
-                    if author_id
-                    else None
-                ),
-                query_vector=query_vector,
-                limit=k // 3,
-            ),
-            self._client.search(
-                collection_name="vector_repositories",
-                query_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="owner_id",
-                            match=models.MatchValue(
-                                value=author_id,
-                            ),
-                        )
-                    ]
-                    if author_id
-                    else None
-                ),
-                query_vector=query_vector,
-                limit=k // 3,
-            ),
+        if not generated_queries:
+            return []
+
+        # Embed all the expanded queries in a single forward pass (cache misses only).
+        query_vectors = self._embedder.encode(generated_queries).tolist()
+
+        collections = [
+            ("vector_posts", "author_id"),
+            ("vector_articles", "author_id"),
+            ("vector_repositories", "owner_id"),
+        ]
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            search_tasks = [
+                executor.submit(
+                    self._search_collection,
+                    collection_name,
+                    author_key,
+                    query_vectors,
+                    author_id,
+                    k,
+                    hnsw_ef,
+                )
+                for collection_name, author_key in collections
+            ]
+            hits_per_collection = [task.result() for task in search_tasks]
+
+        # Group the hits per query: [posts, articles, repositories] for each query.
+        hits = [
+            lib.flatten(query_hits) for query_hits in zip(*hits_per_collection)
         ]
 
-        return lib.flatten(vectors)
+        return lib.flatten(hits)
 
     @opik.track(name="retriever.retrieve_top_k")
-    def retrieve_top_k(self, k: int, to_expand_to_n_queries: int) -> list:
+    def retrieve_top_k(
+        self, k: int, to_expand_to_n_queries: int, hnsw_ef: int | None = None
+    ) -> list:
+        """`hnsw_ef` trades search latency for recall (None = Qdrant's default)."""
+
         generated_queries = self._query_expander.generate_response(
             self.query, to_expand_to_n=to_expand_to_n_queries
         )
@@ -108,16 +121,7 @@ class VectorRetriever:
         else:
             logger.warning("Did not found any author data in the user's prompt.")
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            search_tasks = [
-                executor.submit(self._search_single_query, query, author_id, k)
-                for query in generated_queries
-            ]
-
-            hits = [
-                task.result() for task in concurrent.futures.as_completed(search_tasks)
-            ]
-            hits = lib.flatten(hits)
+        hits = self._search_queries(generated_queries, author_id, k, hnsw_ef)
 
         logger.info("All documents retrieved successfully.", num_documents=len(hits))
 
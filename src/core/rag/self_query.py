@@ -13,11 +13,12 @@ logger = logger_utils.get_logger(__name__)
 
 class SelfQuery:
     opik_tracer = OpikTracer(tags=["SelfQuery"])
+    self_query_template = SelfQueryTemplate()
 
     @staticmethod
     @opik.track(name="SelQuery.generate_response")
     def generate_response(query: str) -> str | None:
-        prompt = SelfQueryTemplate().create_template()
+        prompt = SelfQuery.self_query_template.create_template()
         model = ChatOpenAI(
             model=settings.OPENAI_MODEL_ID,
             api_key=settings.OPENAI_API_KEY,
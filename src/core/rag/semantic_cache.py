@@ -0,0 +1,82 @@
+import time
+from threading import Lock
+from typing import Any, Callable
+
+import numpy as np
+
+import core.logger_utils as logger_utils
+from core.rag.embeddings import CachedEmbedder
+
+logger = logger_utils.get_logger(__name__)
+
+
+class SemanticCache:
+    """
+    Caches results by query meaning: a new query reuses the result of a past query
+    from the same namespace whose embedding has cosine similarity >= `threshold`.
+    """
+
+    def __init__(
+        self,
+        embedder: CachedEmbedder,
+        threshold: float = 0.93,
+        ttl: float = 3600,
+        maxsize: int = 1000,
+    ) -> None:
+        self._embedder = embedder
+        self._threshold = threshold
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # namespace -> (normalized query vectors [n, d], insertion timestamps, values)
+        self._entries: dict[str, tuple[np.ndarray, list[float], list[Any]]] = {}
+        self._lock = Lock()
+
+    def get_or_compute(
+        self, query: str, compute: Callable[[], Any], namespace: str = "default"
+    ) -> Any:
+        vector = self._embedder.encode([query])[0]
+        vector = vector / np.linalg.norm(vector)
+
+        with self._lock:
+            value = self._lookup(namespace, vector)
+        if value is not None:
+            logger.info("Semantic cache hit.", namespace=namespace)
+
+            return value
+
+        value = compute()
+        with self._lock:
+            self._insert(namespace, vector, value)
+
+        return value
+
+    def _lookup(self, namespace: str, vector: np.ndarray) -> Any | None:
+        if namespace not in self._entries:
+            return None
+
+        vectors, timestamps, values = self._entries[namespace]
+        scores = vectors @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self._threshold:
+            return None
+        if time.monotonic() - timestamps[best] > self._ttl:
+            return None
+
+        return values[best]
+
+    def _insert(self, namespace: str, vector: np.ndarray, value: Any) -> None:
+        now = time.monotonic()
+        vectors, timestamps, values = self._entries.get(
+            namespace, (np.empty((0, vector.shape[0]), dtype=vector.dtype), [], [])
+        )
+
+        # Drop expired entries and keep at most `maxsize - 1` of the newest ones.
+        keep = [
+            i for i, timestamp in enumerate(timestamps) if now - timestamp <= self._ttl
+        ]
+        keep = keep[max(0, len(keep) - self._maxsize + 1) :]
+        self._entries[namespace] = (
+            np.vstack([vectors[keep], vector[None, :]]),
+            [timestamps[i] for i in keep] + [now],
+            [values[i] for i in keep] + [value],
+        )
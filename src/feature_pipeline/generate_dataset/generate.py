@@ -168,16 +168,18 @@ class DatasetGenerator:
 
             training_data, testing_data = train_test_split
 
-            file_name_training_data = output_dir / f"{collection_name}_training.json"
-            file_name_testing_data = output_dir / f"{collection_name}_testing.json"
+            # JSON Lines (one sample per line) so the training pipeline can load
+            # the splits without parsing the whole file into memory.
+            file_name_training_data = output_dir / f"{collection_name}_training.jsonl"
+            file_name_testing_data = output_dir / f"{collection_name}_testing.jsonl"
 
             logging.info(f"Writing training data to file: {file_name_training_data}")
             with file_name_training_data.open("w") as f:
-                json.dump(training_data, f)
+                f.writelines(json.dumps(sample) + "\n" for sample in training_data)
 
             logging.info(f"Writing testing data to file: {file_name_testing_data}")
             with file_name_testing_data.open("w") as f:
-                json.dump(testing_data, f)
+                f.writelines(json.dumps(sample) + "\n" for sample in testing_data)
 
             logger.info("Data written to file successfully")
 
@@ -32,6 +32,8 @@ class Settings(BaseSettings):
     TOP_K: int = 5
     KEEP_TOP_K: int = 5
     EXPAND_N_QUERY: int = 5
+    SEMANTIC_CACHE_THRESHOLD: float = 0.93  # Min cosine similarity to reuse a cached context.
+    SEMANTIC_CACHE_TTL: int = 3600  # Seconds a cached context stays valid.
 
     # CometML config
     COMET_API_KEY: str
@@ -5,8 +5,9 @@ import sagemaker
 from config import settings
 from core import logger_utils
 from core.opik_utils import add_to_dataset_with_sampling
+from core.rag.embeddings import get_embedder
 from core.rag.retriever import VectorRetriever
-from langchain.prompts import PromptTemplate
+from core.rag.semantic_cache import SemanticCache
 from opik import opik_context
 from prompt_templates import InferenceTemplate
 from sagemaker.huggingface.model import HuggingFacePredictor
@@ -20,6 +21,9 @@ class LLMTwin:
         self._mock = mock
         self._llm_endpoint = self.build_sagemaker_predictor()
         self.prompt_template_builder = InferenceTemplate()
+        # Built on first use so callers that never hit the cached RAG path don't
+        # load the embedding model.
+        self._semantic_cache: SemanticCache | None = None
 
     def build_sagemaker_predictor(self) -> HuggingFacePredictor:
         return HuggingFacePredictor(
@@ -33,6 +37,7 @@ class LLMTwin:
         query: str,
         enable_rag: bool = False,
         sample_for_evaluation: bool = False,
+        author: str | None = None,
     ) -> dict:
         system_prompt, prompt_template = self.prompt_template_builder.create_template(
             enable_rag=enable_rag
@@ -40,17 +45,21 @@ class LLMTwin:
         prompt_template_variables = {"question": query}
 
         if enable_rag is True:
-            retriever = VectorRetriever(query=query)
-            hits = retriever.retrieve_top_k(
-                k=settings.TOP_K, to_expand_to_n_queries=settings.EXPAND_N_QUERY
-            )
-            context = retriever.rerank(hits=hits, keep_top_k=settings.KEEP_TOP_K)
+            # Retrieval is author-scoped, so cached contexts are namespaced per author.
+            # Without a known author, skip the cache rather than risk serving another
+            # author's documents.
+            if author:
+                context = self.get_semantic_cache().get_or_compute(
+                    query, lambda: self.retrieve_context(query), namespace=author
+                )
+            else:
+                context = self.retrieve_context(query)
             prompt_template_variables["context"] = context
         else:
             context = None
 
         messages, input_num_tokens = self.format_prompt(
-            system_prompt, prompt_template, prompt_template_variables
+            system_prompt, enable_rag, prompt_template_variables
         )
 
         logger.debug(f"Prompt: {pprint.pformat(messages)}")
@@ -80,14 +89,34 @@ class LLMTwin:
 
         return answer
 
+    def get_semantic_cache(self) -> SemanticCache:
+        if self._semantic_cache is None:
+            self._semantic_cache = SemanticCache(
+                get_embedder(settings.EMBEDDING_MODEL_ID),
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                ttl=settings.SEMANTIC_CACHE_TTL,
+            )
+
+        return self._semantic_cache
+
+    def retrieve_context(self, query: str) -> list[str]:
+        retriever = VectorRetriever(query=query)
+        hits = retriever.retrieve_top_k(
+            k=settings.TOP_K, to_expand_to_n_queries=settings.EXPAND_N_QUERY
+        )
+
+        return retriever.rerank(hits=hits, keep_top_k=settings.KEEP_TOP_K)
+
     @opik.track(name="inference_pipeline.format_prompt")
     def format_prompt(
         self,
         system_prompt,
-        prompt_template: PromptTemplate,
+        enable_rag: bool,
         prompt_template_variables: dict,
     ) -> tuple[list[dict[str, str]], int]:
-        prompt = prompt_template.format(**prompt_template_variables)
+        prompt = self.prompt_template_builder.format(
+            enable_rag=enable_rag, **prompt_template_variables
+        )
 
         num_system_prompt_tokens = compute_num_tokens(system_prompt)
         prompt, prompt_num_tokens = truncate_text_to_max_tokens(
@@ -1,4 +1,10 @@
-from core.rag.prompt_templates import BasePromptTemplate
+from typing import Any, Callable
+
+from core.rag.prompt_templates import (
+    BasePromptTemplate,
+    cache_template,
+    compile_template,
+)
 from langchain.prompts import PromptTemplate
 
 
@@ -29,6 +35,20 @@ First try to answer based on the context. If the context is irrelevant answer wi
 {context}
 """
 
+    _format_simple_prompt: Callable[..., str]
+    _format_rag_prompt: Callable[..., str]
+
+    def model_post_init(self, __context: Any) -> None:
+        self._format_simple_prompt = compile_template(self.simple_prompt_template)
+        self._format_rag_prompt = compile_template(self.rag_prompt_template)
+
+    def format(self, enable_rag: bool = True, **variables: Any) -> str:
+        if enable_rag is True:
+            return self._format_rag_prompt(**variables)
+
+        return self._format_simple_prompt(**variables)
+
+    @cache_template
     def create_template(self, enable_rag: bool = True) -> tuple[str, PromptTemplate]:
         if enable_rag is True:
             return self.rag_system_prompt, PromptTemplate(
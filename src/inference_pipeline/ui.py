@@ -34,7 +34,7 @@ def predict(message: str, history: list[list[str]], author: str) -> str:
 
     query = f"I am {author}. Write about: {message}"
     response = llm_twin.generate(
-        query=query, enable_rag=True, sample_for_evaluation=False
+        query=query, enable_rag=True, sample_for_evaluation=False, author=author
     )
 
     return response["answer"]
@@ -1,25 +1,36 @@
 import argparse
-import json
+import hashlib
+import itertools
 import os
 from pathlib import Path
 from typing import Any, List, Optional  # noqa: E402
 
+import orjson
 import torch  # noqa
 from comet_ml import Artifact, Experiment
 from comet_ml.artifacts import ArtifactAsset
-from datasets import Dataset, concatenate_datasets, load_dataset  # noqa: E402
+from datasets import (  # noqa: E402
+    Dataset,
+    IterableDataset,
+    concatenate_datasets,
+    load_dataset,
+    load_from_disk,
+)
+from datasets.fingerprint import Hasher  # noqa: E402
 from transformers import TextStreamer, TrainingArguments  # noqa: E402
 from trl import SFTTrainer  # noqa: E402
 from unsloth import FastLanguageModel, is_bfloat16_supported  # noqa: E402
 from unsloth.chat_templates import get_chat_template  # noqa: E402
 
-ALPACA_TEMPLATE = """Below is an instruction that describes a task. Write a response that appropriately completes the request.
+ALPACA_TEMPLATE_PREFIX = """Below is an instruction that describes a task. Write a response that appropriately completes the request.
 
 ### Instruction:
-{}
+"""
+ALPACA_TEMPLATE_SEPARATOR = """
 
 ### Response:
-{}"""
+"""
+ALPACA_TEMPLATE = ALPACA_TEMPLATE_PREFIX + "{}" + ALPACA_TEMPLATE_SEPARATOR + "{}"
 
 
 class DatasetClient:
@@ -81,12 +92,30 @@ class DatasetClient:
         return asset
 
     def _load_data(self, asset: ArtifactAsset) -> Dataset:
-        data_file_path = asset.local_path_or_data
-        with open(data_file_path, "r") as file:
-            data = json.load(file)
+        data_file_path = str(asset.local_path_or_data)
+        if data_file_path.endswith(".jsonl"):
+            # Parse line by line straight into an on-disk Arrow table, so the
+            # Python heap never holds the full dataset. from_generator caches by
+            # gen_kwargs, and every artifact version is downloaded to the same path,
+            # so key the cache on the file contents too.
+            dataset = Dataset.from_generator(
+                _read_jsonl_samples,
+                gen_kwargs={
+                    "file_path": data_file_path,
+                    "content_hash": _hash_file(data_file_path),
+                },
+            )
+        else:
+            with open(data_file_path, "rb") as file:
+                data = orjson.loads(file.read())
 
-        dataset_dict = {k: [str(d[k]) for d in data] for k in data[0].keys()}
-        dataset = Dataset.from_dict(dataset_dict)
+            # Skip str() for values that are already strings, but still coerce
+            # the rest (e.g. None or numbers in an otherwise string column).
+            dataset_dict = {
+                k: [v if isinstance(v, str) else str(v) for v in (d[k] for d in data)]
+                for k in data[0]
+            }
+            dataset = Dataset.from_dict(dataset_dict)
 
         print(
             f"Successfully loaded dataset from artifact, num_samples = {len(dataset)}",
@@ -95,6 +124,103 @@ class DatasetClient:
         return dataset
 
 
+def materialize_dataset(dataset: IterableDataset) -> Dataset:
+    """Write a streamed dataset to an on-disk Arrow table without buffering it in RAM."""
+
+    return Dataset.from_generator(
+        _iterate_samples, gen_kwargs={"dataset": dataset}, features=dataset.features
+    )
+
+
+def _iterate_samples(dataset: IterableDataset):
+    yield from dataset
+
+
+def _hash_file(file_path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            sha256.update(block)
+
+    return sha256.hexdigest()
+
+
+def _read_jsonl_samples(file_path: str, content_hash: str):
+    with open(file_path, "rb") as file:
+        for line in file:
+            if not line.strip():
+                continue
+
+            sample = orjson.loads(line)
+            yield {k: v if isinstance(v, str) else str(v) for k, v in sample.items()}
+
+
+def pack_dataset(
+    dataset: Dataset, tokenizer: Any, max_seq_length: int, cache_dir: Path
+) -> Dataset:
+    """
+    Tokenize the "text" column and pack it into blocks of `max_seq_length` tokens.
+
+    The packed dataset is saved under `cache_dir`, keyed by the input dataset's
+    fingerprint, so later runs on the same data load it from disk instead.
+    """
+
+    # The packed column layout is part of the key, so caches written with an older
+    # layout are not reused.
+    fingerprint = Hasher.hash(
+        [
+            dataset._fingerprint,
+            tokenizer.name_or_path,
+            max_seq_length,
+            ["input_ids", "attention_mask", "labels"],
+        ]
+    )
+    packed_dataset_path = cache_dir / f"packed_{fingerprint}"
+    if packed_dataset_path.exists():
+        print(f"Loading packed dataset from '{packed_dataset_path}'")  # noqa
+
+        return load_from_disk(str(packed_dataset_path))
+
+    num_proc = max(2, (os.cpu_count() or 1) // 2)
+    dataset = dataset.map(
+        lambda examples: tokenizer(examples["text"]),
+        batched=True,
+        num_proc=num_proc,
+        remove_columns=dataset.column_names,
+    )
+
+    def pack_samples(examples):
+        # Same layout as TRL's ConstantLengthDataset: samples joined by EOS, the
+        # trailing partial block dropped and labels copied from the input ids.
+        token_ids = list(
+            itertools.chain.from_iterable(
+                input_ids + [tokenizer.eos_token_id]
+                for input_ids in examples["input_ids"]
+            )
+        )
+        num_tokens = len(token_ids) // max_seq_length * max_seq_length
+        input_ids = [
+            token_ids[i : i + max_seq_length]
+            for i in range(0, num_tokens, max_seq_length)
+        ]
+
+        return {
+            "input_ids": input_ids,
+            "attention_mask": [[1] * max_seq_length for _ in input_ids],
+            "labels": [ids.copy() for ids in input_ids],
+        }
+
+    dataset = dataset.map(
+        pack_samples,
+        batched=True,
+        num_proc=num_proc,
+        remove_columns=dataset.column_names,
+    )
+    dataset.save_to_disk(str(packed_dataset_path))
+
+    return dataset
+
+
 def load_model(
     model_name: str,
     max_seq_length: int,
@@ -117,6 +243,7 @@ def load_model(
         lora_alpha=lora_alpha,
         lora_dropout=lora_dropout,
         target_modules=target_modules,
+        use_gradient_checkpointing="unsloth",
     )
 
     tokenizer = get_chat_template(
@@ -132,7 +259,7 @@ def finetune(
     output_dir: str,
     dataset_id: str,
     max_seq_length: int = 2048,
-    load_in_4bit: bool = False,
+    load_in_4bit: bool = True,
     lora_rank: int = 32,
     lora_alpha: int = 32,
     lora_dropout: float = 0.0,
@@ -173,42 +300,68 @@ def finetune(
         print(f"Training in dummy mode. Reducing dataset size to '400'.")  # noqa
 
     def format_samples_sft(examples):
-        text = []
-        for instruction, output in zip(
-            examples["instruction"], examples["content"], strict=False
-        ):
-            message = ALPACA_TEMPLATE.format(instruction, output) + EOS_TOKEN
-            text.append(message)
+        text = [
+            ALPACA_TEMPLATE_PREFIX
+            + instruction
+            + ALPACA_TEMPLATE_SEPARATOR
+            + output
+            + EOS_TOKEN
+            for instruction, output in zip(
+                examples["instruction"], examples["content"], strict=False
+            )
+        ]
 
         return {"text": text}
 
     dataset_client = DatasetClient()
     custom_dataset = dataset_client.download_dataset(dataset_id=dataset_id)
+    # Stream only the rows we need instead of downloading and preparing the full
+    # 100k-sample dataset just to slice it.
     static_dataset = load_dataset(
-        "mlabonne/FineTome-Alpaca-100k", split="train[:10000]"
-    )
+        "mlabonne/FineTome-Alpaca-100k", split="train", streaming=True
+    ).take(10000)
+    static_dataset = materialize_dataset(static_dataset)
     dataset = concatenate_datasets([custom_dataset, static_dataset])
     if is_dummy:
         dataset = dataset.select(range(400))
     print(f"Loaded dataset with {len(dataset)} samples.")  # noqa
 
     dataset = dataset.map(
-        format_samples_sft, batched=True, remove_columns=dataset.column_names
+        format_samples_sft,
+        batched=True,
+        batch_size=1000,
+        num_proc=max(2, (os.cpu_count() or 1) // 2),
+        remove_columns=dataset.column_names,
     )
-    dataset = dataset.train_test_split(test_size=0.05)
+
+    # Split the samples before packing so no sample straddles train and eval. The
+    # fixed seed keeps each split's fingerprint (and packed cache key) stable.
+    dataset = dataset.train_test_split(test_size=0.05, seed=0)
 
     print("Training dataset example:")  # noqa
     print(dataset["train"][0])  # noqa
 
+    for split in ["train", "test"]:
+        dataset[split] = pack_dataset(
+            dataset[split],
+            tokenizer,
+            max_seq_length,
+            cache_dir=dataset_client.output_dir,
+        )
+        print(f"Packed {split} split into {len(dataset[split])} sequences.")  # noqa
+
+    num_gpus = max(1, torch.cuda.device_count())
+    dataloader_num_workers = max(2, (os.cpu_count() or 1) // num_gpus)
+
     trainer = SFTTrainer(
         model=model,
         tokenizer=tokenizer,
         train_dataset=dataset["train"],
         eval_dataset=dataset["test"],
-        dataset_text_field="text",
         max_seq_length=max_seq_length,
-        dataset_num_proc=2,
         packing=True,
+        # The dataset is already tokenized and packed by pack_dataset().
+        dataset_kwargs={"skip_prepare_dataset": True},
         args=TrainingArguments(
             learning_rate=learning_rate,
             num_train_epochs=num_train_epochs,
@@ -222,6 +375,12 @@ def finetune(
             lr_scheduler_type="linear",
             per_device_eval_batch_size=per_device_train_batch_size,
             warmup_steps=10,
+            # Collate and copy batches from pinned memory in background workers,
+            # overlapping host-to-device transfers with the training step.
+            dataloader_num_workers=dataloader_num_workers,
+            dataloader_pin_memory=True,
+            dataloader_persistent_workers=True,
+            dataloader_prefetch_factor=4,
             output_dir=output_dir,
             report_to="comet_ml",
             seed=0,
@@ -245,7 +404,11 @@ def inference(
 
     text_streamer = TextStreamer(tokenizer)
     _ = model.generate(
-        **inputs, streamer=text_streamer, max_new_tokens=max_new_tokens, use_cache=True
+        **inputs,
+        streamer=text_streamer,
+        max_new_tokens=max_new_tokens,
+        use_cache=True,
+        do_sample=False,
     )
 
 
@@ -274,6 +437,12 @@ if __name__ == "__main__":
     parser.add_argument("--per_device_train_batch_size", type=int, default=2)
     parser.add_argument("--learning_rate", type=float, default=3e-4)
     parser.add_argument("--model_output_huggingface_workspace", type=str)
+    parser.add_argument(
+        "--load_in_4bit",
+        type=lambda value: str(value).lower() in ["true", "1"],
+        default=True,
+        help="Load the base model in 4-bit (NF4). Set to False to train in 16-bit.",
+    )
     parser.add_argument(
         "--is_dummy",
         type=bool,
@@ -291,6 +460,7 @@ if __name__ == "__main__":
     print(f"Num training epochs: '{args.num_train_epochs}'")  # noqa
     print(f"Per device train batch size: '{args.per_device_train_batch_size}'")  # noqa
     print(f"Learning rate: {args.learning_rate}")  # noqa
+    print(f"Load base model in 4-bit: '{args.load_in_4bit}'")  # noqa
     print(f"Datasets will be loaded from Comet ML artifact: '{args.dataset_id}'")  # noqa
     print(
         f"Models will be saved to Hugging Face workspace: '{args.model_output_huggingface_workspace}'"
@@ -309,6 +479,7 @@ if __name__ == "__main__":
         model_name=args.base_model_name,
         output_dir=str(output_dir_sft),
         dataset_id=args.dataset_id,
+        load_in_4bit=args.load_in_4bit,
         num_train_epochs=args.num_train_epochs,
         per_device_train_batch_size=args.per_device_train_batch_size,
         learning_rate=args.learning_rate,
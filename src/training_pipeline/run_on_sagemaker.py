@@ -1,5 +1,6 @@
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # To mimic using multiple Python modules, such as 'core' and 'feature_pipeline',
@@ -8,8 +9,10 @@ from pathlib import Path
 ROOT_DIR = str(Path(__file__).parent.parent)
 sys.path.append(ROOT_DIR)
 
+import requests
 from core import logger_utils
 from huggingface_hub import HfApi
+from huggingface_hub.utils import RepositoryNotFoundError
 from sagemaker.huggingface import HuggingFace
 
 logger = logger_utils.get_logger(__file__)
@@ -20,6 +23,30 @@ finetuning_dir = Path(__file__).resolve().parent
 finetuning_requirements_path = finetuning_dir / "requirements.txt"
 
 
+@lru_cache(maxsize=64)
+def check_if_huggingface_model_exists(model_id: str, token: str | None = None) -> bool:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    try:
+        response = requests.head(
+            f"https://huggingface.co/api/models/{model_id}", headers=headers, timeout=2
+        )
+        if response.ok:
+            return True
+        if response.status_code == 404:
+            return False
+    except requests.RequestException:
+        logger.warning(f"HEAD request for model '{model_id}' failed.")
+
+    # The Hub answers 401 for missing repos when unauthenticated, and the request can
+    # fail on flaky networks, so confirm with the full (slower) metadata call.
+    try:
+        HfApi().model_info(model_id, token=token, timeout=10)
+    except RepositoryNotFoundError:
+        return False
+
+    return True
+
+
 def run_finetuning_on_sagemaker(
     num_train_epochs: int = 3,
     per_device_train_batch_size: int = 2,
@@ -40,6 +67,10 @@ def run_finetuning_on_sagemaker(
         settings.COMET_PROJECT
     ), "Comet ML project name (COMET_PROJECT) is required. Update your .env file."
 
+    assert check_if_huggingface_model_exists(
+        settings.HUGGINGFACE_BASE_MODEL_ID, token=settings.HUGGINGFACE_ACCESS_TOKEN
+    ), f"Base model '{settings.HUGGINGFACE_BASE_MODEL_ID}' not found on Hugging Face. Update HUGGINGFACE_BASE_MODEL_ID."
+
     if not finetuning_dir.exists():
         raise FileNotFoundError(f"The directory {finetuning_dir} does not exist.")
     if not finetuning_requirements_path.exists():